@@ -1,11 +1,24 @@
 import yfinance as yf
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import time
+import threading
 import pytz
 import feedparser
 import os
+import json
+import calendar
+import re
+import random
+import sched
+import traceback
 import pandas as pd
+import numpy as np
+from collections import deque
 from datetime import datetime, timedelta
+from functools import lru_cache, partial
+from concurrent.futures import ThreadPoolExecutor, wait
 
 # ======================
 # ENV CHECK
@@ -28,40 +41,233 @@ EXPECTED_EIA = -2.0
 
 RSI_OVERBOUGHT = 70
 RSI_OVERSOLD = 30
+RSI_LOOKBACK = 10        # periods of history fed to rsi(); older bars weigh < 0.01%
 VOL_1H_THRESHOLD = 1.3   # catches NFP-type candles
 
-NEWS_URL = "https://feeds.reuters.com/reuters/energyNews"
+# minimum seconds between repeated alerts of the same kind
+RSI_COOLDOWN = 2 * 3600
+VOL_1H_COOLDOWN = 3600
+FALSE_BREAK_COOLDOWN = 45 * 60
+
+POLL_INTERVAL = 30       # base seconds between market/news checks
+QUIET_POLL_INTERVAL = 60 # thin early-morning Asian hours
+QUIET_HOURS = range(1, 6)
+MAX_BACKOFF = 3600       # cap on the retry delay after a failed check
+
+# seconds a history response is reused: half a bar, capped at 5 min
+HISTORY_TTL = {"1m": 30, "5m": 150, "15m": 300, "1h": 300}
+
+NEWS_FEEDS = (
+    "https://feeds.reuters.com/reuters/energyNews",
+)
+NEWS_POLL_INTERVAL = 300   # the feeds update a few times an hour at most
+NEWS_TIMEOUT = (3, 10)     # (connect, read) for one feed request
+NEWS_SEEN_MAX = 500        # headlines remembered for de-duplication
 NEWS_KEYWORDS = [
     "oil", "OPEC", "pipeline", "refinery", "sanctions",
     "Middle East", "attack", "export", "war", "supply"
 ]
+# leading boundary only, so "attacks", "exports" and "Oilfield" still match
+NEWS_RE = re.compile(r"\b(" + "|".join(map(re.escape, NEWS_KEYWORDS)) + r")", re.IGNORECASE)
 
 # ======================
 # STATE (ANTI-SPAM)
 # ======================
 state = {
-    "asia": False,
-    "eu": False,
-    "us": False,
     "last_rsi": None,
     "last_1h": None,
     "false_break": None,
-    "last_news": datetime.now(TZ) - timedelta(hours=2),
+    "fb_last_ts": None,
+    "inventory_pre": {},
+    "rsi_avg": None,
+    "news_since": int(time.time()) - 2 * 3600,   # UTC epoch; ignore older headlines
+    "last_news_poll": None,
+    "news_validators": {},                        # feed url -> (etag, last_modified)
+    "news_seen": deque(maxlen=NEWS_SEEN_MAX),
     "macro_lock": False
 }
 
 # ======================
 # TELEGRAM
 # ======================
+# one keep-alive pool shared by Telegram, EIA, Yahoo and the news feeds
+SESSION = requests.Session()
+_adapter = HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=[500, 502, 503, 504],
+        allowed_methods=["GET"],
+    ),
+)
+# a sendMessage POST that reached Telegram may already have been delivered,
+# so only retry failures to connect; 429s are left to _send_sync
+_telegram_adapter = HTTPAdapter(
+    max_retries=Retry(total=3, connect=3, read=0, status=0, other=0, backoff_factor=0.5),
+)
+SESSION.mount("https://", _adapter)
+SESSION.mount("http://", _adapter)
+SESSION.mount("https://api.telegram.org/", _telegram_adapter)
+# a missed feed is fetched again next NEWS_POLL_INTERVAL, so make one attempt;
+# four read timeouts would outlast CHECK_TIMEOUT
+_feed_adapter = HTTPAdapter(max_retries=0)
+for _url in NEWS_FEEDS:
+    SESSION.mount(_url, _feed_adapter)
+
+class RateLimiter:
+    """Token bucket: `rate` tokens per second, holding at most `capacity`."""
+
+    def __init__(self, rate=1.0, capacity=1):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.ts = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        with self.lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.ts) * self.rate)
+                self.ts = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                time.sleep((1 - self.tokens) / self.rate)
+
+# Telegram allows ~1 msg/s in a chat and 20 msgs/min in a group
+TELEGRAM_LIMITER = RateLimiter(rate=1.0)
+TELEGRAM_MINUTE_LIMITER = RateLimiter(rate=1 / 3, capacity=20)
+
+TELEGRAM_URL = f"https://api.telegram.org/bot{BOT_TOKEN}/sendMessage"
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+def _payload(msg):
+    return json.dumps({"chat_id": CHAT_ID, "text": msg}).encode()
+
+# a single worker keeps messages in the order they were sent
+_SEND_POOL = ThreadPoolExecutor(max_workers=1)
+
+def _send_sync(msg):
+    body = PAYLOADS.get(msg) or _payload(msg)
+    try:
+        for _ in range(3):
+            TELEGRAM_MINUTE_LIMITER.acquire()
+            TELEGRAM_LIMITER.acquire()
+            r = SESSION.post(TELEGRAM_URL, data=body, headers=JSON_HEADERS, timeout=10)
+            if r.status_code != 429:
+                return
+            # Telegram says how long to back off in parameters.retry_after
+            time.sleep(r.json().get("parameters", {}).get("retry_after", 5))
+    except Exception:
+        traceback.print_exc()
+
+DEDUP_WINDOW = 60   # seconds an identical message is suppressed for
+_recent = {}        # msg -> monotonic time it was last queued
+_recent_lock = threading.Lock()
+
 def send(msg):
-    url = f"https://api.telegram.org/bot{BOT_TOKEN}/sendMessage"
-    requests.post(url, json={"chat_id": CHAT_ID, "text": msg})
+    now = time.monotonic()
+    with _recent_lock:
+        for old in [m for m, ts in _recent.items() if now - ts >= DEDUP_WINDOW]:
+            del _recent[old]
+        if msg in _recent:
+            return
+        _recent[msg] = now
+    _SEND_POOL.submit(_send_sync, msg)
+
+# detector alerts raised during one poll go out together as a single message
+ALERT_SEPARATOR = "\n\n━━━━━━━━\n\n"
+_pending = []
+_pending_lock = threading.Lock()
+
+def queue_send(msg):
+    with _pending_lock:
+        _pending.append(msg)
+
+def flush():
+    with _pending_lock:
+        if not _pending:
+            return
+        msg = ALERT_SEPARATOR.join(_pending)
+        _pending.clear()
+    send(msg)
 
 # ======================
 # DATA HELPERS
 # ======================
+_tickers = {}
+
+def get_ticker(symbol):
+    if symbol not in _tickers:
+        _tickers[symbol] = yf.Ticker(symbol)
+    return _tickers[symbol]
+
+_bars = {}
+# yfinance keeps per-call metadata on the Ticker, so concurrent history()
+# calls on one symbol would clean bars with another interval's metadata
+_history_lock = threading.Lock()
+
+def _refresh_bars(symbol, interval, period):
+    with _history_lock:
+        key = (symbol, interval, period)
+        bars = _bars.get(key)
+
+        if bars is not None and not bars.empty:
+            # only pull the latest day and splice it on; the last cached bar may
+            # still have been forming, so the fresh copy replaces it
+            new = get_ticker(symbol).history(interval=interval, period="1d")
+            if not new.empty and new.index[0] <= bars.index[-1]:
+                bars = pd.concat([bars[bars.index < new.index[0]], new]).tail(len(bars))
+                _bars[key] = bars
+                return bars
+
+        # first call, or the fresh slice doesn't overlap (weekend, outage): reseed
+        bars = get_ticker(symbol).history(interval=interval, period=period)
+        _bars[key] = bars
+        return bars
+
+# (interval, period) -> (expires_at on the monotonic clock, arrays)
+_bars_cache = {}
+
 def get_data(interval="1m", period="2d"):
-    return yf.Ticker(SYMBOL).history(interval=interval, period=period)
+    # detectors only index and reduce, so hand them plain arrays rather than
+    # the DataFrame; "index" holds bar open times as int64 epoch ticks
+    key = (interval, period)
+    now = time.monotonic()
+    hit = _bars_cache.get(key)
+    if hit and hit[0] > now:
+        return hit[1]
+
+    bars = _refresh_bars(SYMBOL, interval, period)
+    data = {
+        "index": bars.index.asi8,
+        "high": bars["High"].to_numpy(),
+        "close": bars["Close"].to_numpy(),
+    }
+    _bars_cache[key] = (now + HISTORY_TTL.get(interval, 30), data)
+    return data
+
+SPARK_URL = "https://query1.finance.yahoo.com/v8/finance/spark"
+YAHOO_HEADERS = {"User-Agent": "Mozilla/5.0"}   # Yahoo rejects the default requests agent
+
+def get_price(symbol=SYMBOL):
+    # last price from one small JSON call instead of a 2-day 1m DataFrame;
+    # the endpoint is unofficial, so fall back to yfinance if it changes
+    try:
+        r = SESSION.get(
+            SPARK_URL,
+            params={"symbols": symbol, "range": "1d", "interval": "1m", "indicators": "close"},
+            headers=YAHOO_HEADERS,
+            timeout=5,
+        )
+        r.raise_for_status()
+        closes = r.json()["spark"]["result"][0]["response"][0]["indicators"]["quote"][0]["close"]
+        return next(c for c in reversed(closes) if c is not None)
+    except (requests.RequestException, ValueError, LookupError, TypeError, StopIteration):
+        return get_data()["close"][-1]
 
 def pct(a, b):
     return round(((b - a) / a) * 100, 2)
@@ -69,64 +275,76 @@ def pct(a, b):
 # ======================
 # RSI
 # ======================
-def rsi(series, period=14):
-    delta = series.diff()
-    gain = delta.clip(lower=0)
-    loss = -delta.clip(upper=0)
-    rs = gain.rolling(period).mean() / loss.rolling(period).mean()
-    return 100 - (100 / (1 + rs))
-
-# ======================
-# SESSION ALERTS
-# ======================
-def session_alerts(now):
-    if now.hour == 6 and not state["asia"]:
-        send("🌏 ASIA SESSION OPEN\nLow liquidity → fake moves possible")
-        state["asia"] = True
-
-    if now.hour == 13 and not state["eu"]:
-        send("🇪🇺 EUROPE SESSION OPEN\nTrend continuation / reversals")
-        state["eu"] = True
-
-    if now.hour == 18 and not state["us"]:
-        send("🇺🇸 US SESSION OPEN\n⚠️ High volatility window")
-        state["us"] = True
+def _wilder_seed(close, period):
+    # Wilder's smoothing (RMA) is an EMA with alpha = 1/period. A bar n steps
+    # back weighs (1 - 1/period)**n, so only the last RSI_LOOKBACK periods matter.
+    close = close[-(RSI_LOOKBACK * period + 1):]
+    delta = np.diff(close)
+    gain = np.where(delta > 0, delta, 0.0)
+    loss = np.where(delta < 0, -delta, 0.0)
+
+    # smooth gains and losses together in a single ewm pass
+    avg = pd.DataFrame(np.column_stack((gain, loss))).ewm(alpha=1 / period, adjust=False).mean().to_numpy()
+    return avg[-1]
+
+def _wilder_step(avg_gain, avg_loss, delta, period):
+    # comparisons rather than max() so a NaN close counts as no move, as in
+    # _wilder_seed, instead of poisoning the committed averages
+    return (
+        (avg_gain * (period - 1) + (delta if delta > 0 else 0.0)) / period,
+        (avg_loss * (period - 1) + (-delta if delta < 0 else 0.0)) / period,
+    )
 
-    if now.hour == 0:
-        state["asia"] = state["eu"] = state["us"] = False
+def rsi(bars, period=14):
+    index, close = bars["index"], bars["close"]
+
+    # averages are committed up to the last closed bar and only advanced
+    # over bars that closed since; reseed on first use, after a gap, or if
+    # the averages have gone non-finite
+    avg = state["rsi_avg"]
+    start = np.searchsorted(index, avg["ts"]) if avg else len(index)
+    if start >= len(index) or index[start] != avg["ts"] or not np.isfinite([avg["gain"], avg["loss"]]).all():
+        avg_gain, avg_loss = _wilder_seed(close[:-1], period)
+    else:
+        avg_gain, avg_loss = avg["gain"], avg["loss"]
+        for delta in np.diff(close[start:-1]):
+            avg_gain, avg_loss = _wilder_step(avg_gain, avg_loss, delta, period)
+    state["rsi_avg"] = {"gain": avg_gain, "loss": avg_loss, "ts": index[-2]}
+
+    # the last bar is still forming: fold it in without committing it
+    avg_gain, avg_loss = _wilder_step(avg_gain, avg_loss, close[-1] - close[-2], period)
+    if avg_loss == 0:
+        return 100.0 if avg_gain > 0 else 50.0
+    return 100 - (100 / (1 + avg_gain / avg_loss))
 
 # ======================
 # RSI ALERT
 # ======================
-def rsi_alert():
+def rsi_alert(now):
     data = get_data("15m", "3d")
-    r = rsi(data["Close"]).iloc[-1]
-    now = datetime.now(TZ)
+    r = rsi(data)
 
     if r >= RSI_OVERBOUGHT:
-        if not state["last_rsi"] or now - state["last_rsi"] > timedelta(hours=2):
-            send(f"📈 RSI OVERBOUGHT\nRSI: {round(r,2)}\nUpside exhaustion risk")
+        if not state["last_rsi"] or now - state["last_rsi"] > RSI_COOLDOWN:
+            queue_send(f"📈 RSI OVERBOUGHT\nRSI: {round(r,2)}\nUpside exhaustion risk")
             state["last_rsi"] = now
 
     if r <= RSI_OVERSOLD:
-        if not state["last_rsi"] or now - state["last_rsi"] > timedelta(hours=2):
-            send(f"📉 RSI OVERSOLD\nRSI: {round(r,2)}\nBounce potential")
+        if not state["last_rsi"] or now - state["last_rsi"] > RSI_COOLDOWN:
+            queue_send(f"📉 RSI OVERSOLD\nRSI: {round(r,2)}\nBounce potential")
             state["last_rsi"] = now
 
 # ======================
 # 1H VOLATILITY (MACRO SHOCK)
 # ======================
-def check_1h_vol():
+def check_1h_vol(now):
     data = get_data("1h", "3d")
-    prev = data["Close"].iloc[-2]
-    last = data["Close"].iloc[-1]
+    prev, last = data["close"][-2], data["close"][-1]
     move = pct(prev, last)
 
-    now = datetime.now(TZ)
-
     if abs(move) >= VOL_1H_THRESHOLD:
-        if not state["last_1h"] or now - state["last_1h"] > timedelta(hours=1):
-            send(
+        if not state["last_1h"] or now - state["last_1h"] > VOL_1H_COOLDOWN:
+            queue_send(
                 f"🚨 MACRO SHOCK DETECTED\n\n"
                 f"1H Move: {move}%\nWTI: {round(last,2)}\n\n"
                 f"Risk-Off Conditions\n"
@@ -138,18 +356,22 @@ def check_1h_vol():
 # ======================
 # FALSE BREAKOUT (CONTROLLED)
 # ======================
-def false_breakout():
-    data = get_data("5m", "2d")
-    level = data["High"].iloc[-50:-1].max()
-    candle = data.iloc[-2]
-
-    now = datetime.now(TZ)
+def false_breakout(now):
+    if state["false_break"] and now - state["false_break"] < FALSE_BREAK_COOLDOWN:
+        return
 
-    if state["false_break"] and now - state["false_break"] < timedelta(minutes=45):
+    data = get_data("5m", "2d")
+    # everything below depends only on closed bars, so check each candle once
+    if data["index"][-1] == state["fb_last_ts"]:
         return
+    state["fb_last_ts"] = data["index"][-1]
+
+    high, close = data["high"], data["close"]
+    # test the last closed candle against the 49 bars before it
+    level = high[-51:-2].max()
 
-    if candle["High"] > level and candle["Close"] < level:
-        send(
+    if high[-2] > level and close[-2] < level:
+        queue_send(
             f"⚠️ FALSE BREAKOUT\n"
             f"Liquidity sweep above {round(level,2)}\n"
             f"Price rejected"
@@ -159,7 +381,9 @@ def false_breakout():
 # ======================
 # EIA ACTUAL DATA
 # ======================
-def fetch_eia():
+@lru_cache(maxsize=8)
+def _fetch_eia_cached(day):
+    # `day` only keys the cache; the weekly series changes at most once a day
     url = (
         "https://api.eia.gov/v2/petroleum/stocks/data/"
         f"?api_key={EIA_API_KEY}"
@@ -170,46 +394,78 @@ def fetch_eia():
         "&sort[0][direction]=desc"
         "&length=1"
     )
-    r = requests.get(url).json()
-    return round(r["response"]["data"][0]["value"], 2)
+    r = SESSION.get(url, timeout=(3, 10))   # (connect, read)
+    r.raise_for_status()
+    return round(r.json()["response"]["data"][0]["value"], 2)
+
+def fetch_eia():
+    return _fetch_eia_cached(datetime.now(TZ).date().isoformat())
 
 # ======================
 # INVENTORY EVENTS
 # ======================
-def inventory(name, expected, is_eia=False):
-    pre = get_data()["Close"].iloc[-1]
+def inventory_pre(name):
+    pre = get_price()
+    state["inventory_pre"][name] = pre
     send(f"🛢️ {name} RELEASE\nPre Price: {round(pre,2)}")
 
-    time.sleep(900)
-
-    post = get_data()["Close"].iloc[-1]
+def inventory_post(name, expected, is_eia=False):
+    pre = state["inventory_pre"].pop(name, None)   # None if the pre snapshot failed
+    post = get_price()
     actual = fetch_eia() if is_eia else expected
     bias = "📈 Bullish" if actual < expected else "📉 Bearish"
 
     send(
         f"📊 {name} SUMMARY\n\n"
         f"Expected: {expected}M\nActual: {actual}M\n\n"
-        f"Pre: {round(pre,2)}\nPost: {round(post,2)}\n\n"
+        f"Pre: {round(pre,2) if pre is not None else 'n/a'}\nPost: {round(post,2)}\n\n"
         f"{bias}"
     )
 
 # ======================
 # NEWS
 # ======================
-def check_news():
-    feed = feedparser.parse(NEWS_URL)
-    for e in feed.entries[:5]:
-        published = datetime(*e.published_parsed[:6], tzinfo=pytz.UTC).astimezone(TZ)
-        if published > state["last_news"]:
-            if any(k in e.title.lower() for k in NEWS_KEYWORDS):
-                send(f"🚨 ENERGY HEADLINE\n\n{e.title}")
-                state["last_news"] = published
+def _fetch_feed(url):
+    etag, modified = state["news_validators"].get(url, (None, None))
+    headers = {}
+    if etag:
+        headers["If-None-Match"] = etag
+    if modified:
+        headers["If-Modified-Since"] = modified
+
+    try:
+        r = SESSION.get(url, headers=headers, timeout=NEWS_TIMEOUT)
+    except requests.RequestException:
+        # an unreachable feed is skipped for this round, as feedparser.parse(url) did
+        traceback.print_exc()
+        return []
+    if r.status_code == 304 or not r.ok:
+        return []
+
+    state["news_validators"][url] = (r.headers.get("ETag"), r.headers.get("Last-Modified"))
+    return feedparser.parse(r.content).entries[:5]
+
+def check_news(now):
+    if state["last_news_poll"] and now - state["last_news_poll"] < NEWS_POLL_INTERVAL:
+        return
+    state["last_news_poll"] = now
+
+    for url in NEWS_FEEDS:
+        for e in _fetch_feed(url):
+            # keyed on the headline so the same story from two feeds alerts once
+            key = e.title.casefold()
+            if key in state["news_seen"]:
+                continue
+            state["news_seen"].append(key)
+
+            if calendar.timegm(e.published_parsed) > state["news_since"] and NEWS_RE.search(e.title):
+                queue_send(f"🚨 ENERGY HEADLINE\n\n{e.title}")
 
 # ======================
 # DAILY MACRO BRIEF
 # ======================
 def daily_brief():
-    price = get_data()["Close"].iloc[-1]
+    price = get_price()
     send(
         f"🛢️ DAILY CRUDE BRIEF (IST)\n\n"
         f"WTI: {round(price,2)}\n\n"
@@ -220,34 +476,146 @@ def daily_brief():
     )
 
 # ======================
-# MAIN LOOP
+# SCHEDULE (IST)
 # ======================
-def main():
-    send("🚀 Crude Master Bot LIVE (IST)")
-    last_brief = None
+# name -> (hour, minute, message)
+SESSION_OPENS = {
+    "asia": (6, 0, "🌏 ASIA SESSION OPEN\nLow liquidity → fake moves possible"),
+    "eu": (13, 0, "🇪🇺 EUROPE SESSION OPEN\nTrend continuation / reversals"),
+    "us": (18, 0, "🇺🇸 US SESSION OPEN\n⚠️ High volatility window"),
+}
+
+# fixed texts are encoded once; dynamic alerts are encoded per send
+PAYLOADS = {msg: _payload(msg) for _, _, msg in SESSION_OPENS.values()}
+
+# (weekday or None for daily, hour, minute, job)
+SCHEDULE = [
+    *((None, hour, minute, partial(send, msg)) for hour, minute, msg in SESSION_OPENS.values()),
+    (None, 9, 0, daily_brief),
+    # inventory summaries go out 15 min after the release
+    (1, 20, 0, partial(inventory_pre, "API Inventory")),
+    (1, 20, 15, partial(inventory_post, "API Inventory", EXPECTED_API)),
+    (2, 20, 0, partial(inventory_pre, "EIA Inventory")),
+    (2, 20, 15, partial(inventory_post, "EIA Inventory", EXPECTED_EIA, True)),
+]
+
+# scheduled jobs run here so a slow one never stalls the scheduler
+JOBS = ThreadPoolExecutor(max_workers=4)
+
+def run_job(job):
+    try:
+        job()
+    except Exception:
+        traceback.print_exc()
+
+MINUTES_PER_DAY = 24 * 60
+MINUTES_PER_WEEK = 7 * MINUTES_PER_DAY
+
+# (minute of week, repeat period in minutes, job); daily events use minute of day
+EVENTS = [
+    ((weekday or 0) * MINUTES_PER_DAY + hour * 60 + minute,
+     MINUTES_PER_DAY if weekday is None else MINUTES_PER_WEEK,
+     job)
+    for weekday, hour, minute, job in SCHEDULE
+]
 
-    while True:
-        now = datetime.now(TZ)
+def minute_of_week(t):
+    return t.weekday() * MINUTES_PER_DAY + t.hour * 60 + t.minute
 
-        session_alerts(now)
-        rsi_alert()
-        false_breakout()
-        check_1h_vol()
-        check_news()
+def next_occurrence(mow, period, after):
+    ahead = (mow - minute_of_week(after)) % period
+    fire = after.replace(second=0, microsecond=0) + timedelta(minutes=ahead)
+    if fire <= after:
+        fire += timedelta(minutes=period)
+    return fire
 
-        if now.hour == 9 and now.minute == 0 and last_brief != now.date():
-            daily_brief()
-            last_brief = now.date()
+# ======================
+# MAIN LOOP
+# ======================
+SCHEDULER = sched.scheduler(time.time, time.sleep)
+
+def schedule_event(mow, period, job, after):
+    fire = next_occurrence(mow, period, after)
+    SCHEDULER.enterabs(fire.timestamp(), 1, fire_event, (mow, period, job, fire))
+
+def fire_event(mow, period, job, fire):
+    JOBS.submit(run_job, job)
+    schedule_event(mow, period, job, fire)
+
+# independent detectors; each does its own network I/O, so they run side by side
+CHECKS = (rsi_alert, false_breakout, check_1h_vol, check_news)
+CHECK_TIMEOUT = sum(NEWS_TIMEOUT) + 2   # seconds a tick waits; covers one unretried feed request
+_POLL_POOL = ThreadPoolExecutor(max_workers=len(CHECKS))
+# check -> its latest future; a detector that outlives CHECK_TIMEOUT is not
+# started again until it finishes, since copies would race on `state`
+_in_flight = {}
+# check -> (monotonic time it may run again, its next backoff) after a failure;
+# each detector backs off alone so one outage doesn't delay the healthy ones
+_backoff = {}
+
+def _log_late(future):
+    if future.exception():
+        traceback.print_exception(future.exception())
+
+def next_poll_delay():
+    # polling faster than POLL_INTERVAL would only re-read bars cached for
+    # HISTORY_TTL and a news gate of NEWS_POLL_INTERVAL, so only slow down
+    if datetime.now(TZ).hour in QUIET_HOURS:
+        base = QUIET_POLL_INTERVAL
+    else:
+        base = POLL_INTERVAL
+
+    # jitter so we don't hit Yahoo/Reuters in lockstep with other pollers
+    return base * random.uniform(0.8, 1.2)
+
+def poll():
+    now = time.monotonic()   # one clock read per tick; cooldowns only need elapsed time
+    futures = {}
+    for check in CHECKS:
+        running = _in_flight.get(check)
+        if running and not running.done():
+            continue   # already reported as timed out
+        if check in _backoff and now < _backoff[check][0]:
+            continue
+        _in_flight[check] = _POLL_POOL.submit(check, now)
+        futures[_in_flight[check]] = check
+
+    done, hung = wait(futures, timeout=CHECK_TIMEOUT)
+    flush()
+
+    errors = {futures[f]: f"timed out after {CHECK_TIMEOUT}s" for f in hung}
+    for f in hung:
+        f.add_done_callback(_log_late)
+    for f in done:
+        if f.exception():
+            traceback.print_exception(f.exception())
+            errors[futures[f]] = f.exception()
+        else:
+            _backoff.pop(futures[f], None)
+
+    lines = []
+    for check, error in errors.items():
+        # back off exponentially so an outage doesn't become an error message every minute;
+        # jittered like next_poll_delay() so retries don't land in lockstep with other clients
+        backoff = _backoff.get(check, (None, POLL_INTERVAL))[1]
+        delay = round(backoff * random.uniform(0.8, 1.2))
+        _backoff[check] = (now + delay, min(backoff * 2, MAX_BACKOFF))
+        lines.append(f"{check.__name__}: {error}\nRetrying in {delay}s")
+    if lines:
+        send("❌ BOT ERROR\n" + "\n".join(lines))
+
+    SCHEDULER.enter(next_poll_delay(), 2, poll)
 
-        if now.weekday() == 1 and now.hour == 20 and now.minute == 0:
-            inventory("API Inventory", EXPECTED_API)
-            time.sleep(3600)
+def main():
+    send("🚀 Crude Master Bot LIVE (IST)")
 
-        if now.weekday() == 2 and now.hour == 20 and now.minute == 0:
-            inventory("EIA Inventory", EXPECTED_EIA, True)
-            time.sleep(3600)
+    now = datetime.now(TZ)
+    for mow, period, job in EVENTS:
+        schedule_event(mow, period, job, now)
+    SCHEDULER.enter(0, 2, poll)
 
-        time.sleep(30)
+    # sleeps until the earliest queued event; nothing wakes in between
+    SCHEDULER.run()
 
 # ======================
 # RUN